@@ -119,7 +119,7 @@ CREATE TABLE IF NOT EXISTS punjab_property_tax.property_owner_entity
     created_time DateTime64(3),
     last_modified_by String,
     last_modified_time DateTime64(3),
-    
+
     -- Property columns
     property_id String,
     property_type LowCardinality(String),
@@ -127,6 +127,9 @@ CREATE TABLE IF NOT EXISTS punjab_property_tax.property_owner_entity
     property_status LowCardinality(String),
     no_of_floors Int8,
 
+    -- Skip index: owners are keyed by owner_info_uuid but looked up by property
+    INDEX idx_property_id property_id TYPE bloom_filter(0.01) GRANULARITY 3
+
 )
 ENGINE = ReplacingMergeTree(last_modified_time)
 ORDER BY (tenant_id, owner_info_uuid)
@@ -200,7 +203,10 @@ CREATE TABLE IF NOT EXISTS punjab_property_tax.demand_with_details_entity
     created_time DateTime64(3),
     last_modified_by String,
     last_modified_time DateTime64(3),
-    
+
+    -- Skip index: demands are keyed by demand_id but joined/filtered by property
+    INDEX idx_consumer_code consumer_code TYPE bloom_filter(0.01) GRANULARITY 3
+
 )
 ENGINE = ReplacingMergeTree(last_modified_time)
 ORDER BY (tenant_id, demand_id)
@@ -256,7 +262,10 @@ CREATE TABLE IF NOT EXISTS punjab_property_tax.payment_with_details_entity
     businessservice LowCardinality(String),
     billid String,
     manualreceiptnumber String,
-    manualreceiptdate DateTime64(3)
+    manualreceiptdate DateTime64(3),
+
+    -- Skip index: payments join to bills through billid
+    INDEX idx_billid billid TYPE bloom_filter(0.01) GRANULARITY 3
 
 )
 ENGINE = ReplacingMergeTree(last_modified_time)
@@ -297,8 +306,10 @@ CREATE TABLE IF NOT EXISTS punjab_property_tax.bill_entity
     created_time DateTime64(3),
     last_modified_by String,
     last_modified_time DateTime64(3),
-    financial_year LowCardinality(String)
+    financial_year LowCardinality(String),
 
+    -- Skip index: bills are keyed by bill_id but looked up by property
+    INDEX idx_consumercode consumercode TYPE bloom_filter(0.01) GRANULARITY 3
 
 )
 ENGINE = ReplacingMergeTree(last_modified_time)
@@ -329,6 +340,9 @@ CREATE TABLE IF NOT EXISTS punjab_property_tax.property_assessment_entity
     last_modified_by String,
     last_modified_time DateTime64(3),
 
+    -- Skip index: assessments are keyed by assessmentnumber but joined by property
+    INDEX idx_propertyid propertyid TYPE bloom_filter(0.01) GRANULARITY 3
+
 )
 ENGINE = ReplacingMergeTree(last_modified_time)
 ORDER BY (tenant_id, assessmentnumber)
@@ -387,7 +401,10 @@ CREATE TABLE IF NOT EXISTS punjab_property_tax.bill_detail_entity
     last_modified_time DateTime64(3),
 
     --Calculate financial year based on from period and to period
-    financial_year String
+    financial_year String,
+
+    -- Skip index: bill details join to payments/bills through bill_id
+    INDEX idx_bill_id bill_id TYPE bloom_filter(0.01) GRANULARITY 3
 )
 ENGINE = ReplacingMergeTree(last_modified_time)
 ORDER BY (tenant_id, id)
@@ -13,12 +13,15 @@ Usage:
 """
 
 import argparse
-import json
-import random
+import sys
 import time
 import uuid
 from datetime import datetime
-from kafka import KafkaProducer
+from functools import lru_cache
+
+import numpy as np
+import orjson
+from confluent_kafka import Producer
 
 # Configuration
 NUM_PROPERTIES = 10000
@@ -28,6 +31,9 @@ KAFKA_TOPIC = "demand-events"
 # Reference data
 TENANTS = ["pb.amritsar", "pb.jalandhar", "pb.ludhiana", "pb.patiala"]
 
+# Derived lookup table, computed once instead of per event
+TENANT_CODES = [t.split(".")[1].upper() for t in TENANTS]
+
 # Financial years: April 1 to March 31
 FINANCIAL_YEARS = [
     ("2018-19", datetime(2018, 4, 1), datetime(2019, 3, 31)),
@@ -57,6 +63,48 @@ LAST_NAMES = [
     "Kaur", "Gill", "Sidhu", "Dhillon", "Malhotra",
 ]
 
+# ----------------------------------------------------------------------------
+# Vectorized randomness (same pattern as generate_properties.py)
+# ----------------------------------------------------------------------------
+# Draw blocks of values at once from NumPy's PCG64 Generator and hand them
+# out one at a time, instead of paying a stdlib random.* call per field.
+
+_RNG_BLOCK = 4096
+
+rng = np.random.default_rng()
+
+
+def _block_stream(draw):
+    """Yield scalars from vectorized draws, refilling one block at a time."""
+    while True:
+        for value in draw(_RNG_BLOCK):
+            yield value
+
+
+@lru_cache(maxsize=None)
+def _int_stream(low, high):
+    return _block_stream(lambda n: rng.integers(low, high + 1, size=n))
+
+
+@lru_cache(maxsize=None)
+def _float_stream(low, high):
+    return _block_stream(lambda n: rng.uniform(low, high, size=n))
+
+
+def rand_int(low, high):
+    """Drop-in for random.randint(low, high) backed by block draws."""
+    return int(next(_int_stream(low, high)))
+
+
+def rand_uniform(low, high):
+    """Drop-in for random.uniform(low, high) backed by block draws."""
+    return float(next(_float_stream(low, high)))
+
+
+def rand_choice(seq):
+    """Drop-in for random.choice(seq) backed by block draws."""
+    return seq[int(next(_int_stream(0, len(seq) - 1)))]
+
 
 def datetime_to_millis(dt: datetime) -> int:
     """Convert datetime to milliseconds timestamp."""
@@ -67,20 +115,20 @@ def generate_demand_details(demand_id: str, fy_start: datetime) -> list:
     """Generate 2-3 tax heads for a demand."""
     # Always include PT_TAX, randomly include others
     tax_heads_to_use = [TAX_HEADS[0]]  # PT_TAX always
-    if random.random() > 0.3:
+    if rand_uniform(0.0, 1.0) > 0.3:
         tax_heads_to_use.append(TAX_HEADS[1])  # PT_LATE_FEE 70%
-    if random.random() > 0.5:
+    if rand_uniform(0.0, 1.0) > 0.5:
         tax_heads_to_use.append(TAX_HEADS[2])  # PT_CESS 50%
 
     details = []
     for tax_head_code, tax_head_name in tax_heads_to_use:
         # Base tax amount varies by tax head
         if tax_head_code == "PT_TAX":
-            tax_amount = round(random.uniform(5000, 50000), 2)
+            tax_amount = round(rand_uniform(5000, 50000), 2)
         elif tax_head_code == "PT_LATE_FEE":
-            tax_amount = round(random.uniform(100, 2000), 2)
+            tax_amount = round(rand_uniform(100, 2000), 2)
         else:  # PT_CESS
-            tax_amount = round(random.uniform(200, 3000), 2)
+            tax_amount = round(rand_uniform(200, 3000), 2)
 
         details.append({
             "id": str(uuid.uuid4()),
@@ -108,19 +156,19 @@ def generate_demand_event(
     demand_id = str(uuid.uuid4())
 
     # Demand created a few months into the financial year
-    created_month = random.randint(4, 8)  # April to August
+    created_month = rand_int(4, 8)  # April to August
     created_dt = datetime(
         fy_start.year,
         created_month,
-        random.randint(1, 28),
-        random.randint(9, 17),
-        random.randint(0, 59),
+        rand_int(1, 28),
+        rand_int(9, 17),
+        rand_int(0, 59),
     )
     created_time = datetime_to_millis(created_dt)
 
     # Payer info
-    first_name = random.choice(FIRST_NAMES)
-    last_name = random.choice(LAST_NAMES)
+    first_name = rand_choice(FIRST_NAMES)
+    last_name = rand_choice(LAST_NAMES)
 
     demand_details = generate_demand_details(demand_id, fy_start)
 
@@ -143,7 +191,7 @@ def generate_demand_event(
             "minimumAmountPayable": str(round(total_tax, 2)),
             "payer": {
                 "name": f"{first_name} {last_name}",
-                "mobileNumber": f"98{random.randint(10000000, 99999999)}",
+                "mobileNumber": f"98{rand_int(10000000, 99999999)}",
                 "email": f"{first_name.lower()}.{last_name.lower()}@example.com",
             },
             "demandDetails": demand_details,
@@ -158,12 +206,22 @@ def generate_demand_event(
     }
 
 
+def produce_with_backpressure(producer, topic, value, key=None):
+    """produce() that waits out a full local queue instead of dropping."""
+    while True:
+        try:
+            producer.produce(topic, value=value, key=key)
+            return
+        except BufferError:
+            producer.poll(0.1)
+
+
 def get_property_info(property_index: int) -> tuple:
     """Get tenant_id and property_id for a property index."""
     # Distribute properties across tenants
     tenant_index = property_index % len(TENANTS)
     tenant_id = TENANTS[tenant_index]
-    property_id = f"PT-{tenant_id.split('.')[1].upper()}-{property_index:06d}"
+    property_id = f"PT-{TENANT_CODES[tenant_index]}-{property_index:06d}"
     return tenant_id, property_id
 
 
@@ -192,21 +250,27 @@ def main():
     if args.dry_run:
         # Print sample events for first property
         tenant_id, property_id = get_property_info(1)
+        out = sys.stdout.buffer
         for fy_info in FINANCIAL_YEARS[:2]:  # Just first 2 FYs
             event = generate_demand_event(1, tenant_id, property_id, fy_info)
-            print(json.dumps(event, indent=2))
-            print("---")
+            out.write(orjson.dumps(event, option=orjson.OPT_INDENT_2))
+            out.write(b"\n---\n")
+        out.flush()
         print(f"[DRY RUN] Would generate {total_demands:,} demand events")
         print(f"  ({args.num_properties:,} properties x {DEMANDS_PER_PROPERTY} FYs)")
         return
 
-    # Create Kafka producer
-    producer = KafkaProducer(
-        bootstrap_servers=args.bootstrap_servers,
-        value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-        acks="all",
-        retries=3,
-    )
+    # librdkafka producer. Batch aggressively: this is synthetic test data,
+    # so acks=1 is enough and lingering lets the producer pack many small
+    # events per broker request.
+    producer = Producer({
+        "bootstrap.servers": args.bootstrap_servers,
+        "acks": "1",
+        "linger.ms": 50,
+        "batch.num.messages": 10000,
+        "compression.type": "lz4",
+        "queue.buffering.max.messages": 200000,
+    })
 
     print(f"Generating {total_demands:,} demand events...")
     print(f"  ({args.num_properties:,} properties x {DEMANDS_PER_PROPERTY} FYs)")
@@ -218,17 +282,16 @@ def main():
 
         for fy_info in FINANCIAL_YEARS:
             event = generate_demand_event(prop_idx, tenant_id, property_id, fy_info)
-            producer.send(KAFKA_TOPIC, value=event)
+            produce_with_backpressure(producer, KAFKA_TOPIC, orjson.dumps(event), key=tenant_id)
+            producer.poll(0)
             event_count += 1
 
         if prop_idx % 1000 == 0:
-            producer.flush()
             elapsed = time.time() - start_time
             rate = event_count / elapsed
             print(f"  Processed {prop_idx:,} properties, {event_count:,} demands ({rate:.0f} events/sec)")
 
     producer.flush()
-    producer.close()
 
     elapsed = time.time() - start_time
     print(f"Completed: {event_count:,} demand events in {elapsed:.1f}s")
@@ -18,12 +18,18 @@ Usage:
 """
 
 import argparse
-import json
-import random
+import bisect
+import os
+import sys
 import time
-import uuid
-from datetime import datetime, timedelta
-from kafka import KafkaProducer
+from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
+from multiprocessing import Pool
+
+import numpy as np
+import orjson
+from confluent_kafka import Producer
 
 # Configuration
 NUM_PROPERTIES = 10000
@@ -87,6 +93,29 @@ CITIES = {
     "pb.patiala": ("Patiala", "Patiala", "Punjab"),
 }
 
+# Derived lookup tables, computed once instead of per event
+TENANT_CODES = [t.split(".")[1].upper() for t in TENANTS]
+FY_BY_YEAR = {y: f"{y}-{(y + 1) % 100:02d}" for y in range(2017, 2025)}
+OCCUPANCY_DATES = [
+    f"{year}-{month:02d}-{day:02d}"
+    for year in range(2015, 2024)
+    for month in range(1, 13)
+    for day in range(1, 29)
+]
+
+# Address fields that never vary within a tenant, pre-built once so
+# generate_address only fills in the variable fields per event
+TENANT_ADDRESS_CONST = {
+    tenant_id: {
+        "city": city,
+        "district": district,
+        "region": "North",
+        "state": state,
+        "country": "IN",
+    }
+    for tenant_id, (city, district, state) in CITIES.items()
+}
+
 FIRST_NAMES = [
     "Rajesh", "Sunil", "Anil", "Vijay", "Sandeep",
     "Amit", "Deepak", "Rakesh", "Mukesh", "Manoj",
@@ -99,37 +128,155 @@ LAST_NAMES = [
     "Kaur", "Gill", "Sidhu", "Dhillon", "Malhotra",
 ]
 
+# Derived name tables, computed once instead of per owner; the first ten
+# first names are the male ones
+NAME_GENDER = {name: ("MALE" if i < 10 else "FEMALE") for i, name in enumerate(FIRST_NAMES)}
+FIRST_NAMES_LOWER = [name.lower() for name in FIRST_NAMES]
+LAST_NAMES_LOWER = [name.lower() for name in LAST_NAMES]
 
-def random_timestamp(start_year: int, end_year: int) -> int:
-    """Generate random timestamp in milliseconds between years."""
+# ----------------------------------------------------------------------------
+# Vectorized randomness
+# ----------------------------------------------------------------------------
+# Each event draws ~40 random values; per-field random.* calls make interpreter
+# overhead dominate generation time. Instead, draw blocks of values at once
+# with NumPy's Generator and hand them out one at a time.
+
+_RNG_BLOCK = 4096
+
+rng = np.random.default_rng()
+
+
+def _init_worker():
+    """Give each pool worker an independent RNG stream."""
+    global rng, _uuids
+    rng = np.random.default_rng(os.getpid() ^ time.time_ns())
+    _int_stream.cache_clear()
+    _float_stream.cache_clear()
+    _uuids = _uuid_stream()
+
+
+def _block_stream(draw):
+    """Yield scalars from vectorized draws, refilling one block at a time."""
+    while True:
+        for value in draw(_RNG_BLOCK):
+            yield value
+
+
+@lru_cache(maxsize=None)
+def _int_stream(low, high):
+    return _block_stream(lambda n: rng.integers(low, high + 1, size=n))
+
+
+@lru_cache(maxsize=None)
+def _float_stream(low, high):
+    return _block_stream(lambda n: rng.uniform(low, high, size=n))
+
+
+def rand_int(low, high):
+    """Drop-in for random.randint(low, high) backed by block draws."""
+    return int(next(_int_stream(low, high)))
+
+
+def rand_uniform(low, high):
+    """Drop-in for random.uniform(low, high) backed by block draws."""
+    return float(next(_float_stream(low, high)))
+
+
+def rand_choice(seq):
+    """Drop-in for random.choice(seq) backed by block draws."""
+    return seq[int(next(_int_stream(0, len(seq) - 1)))]
+
+
+def round2(x: float) -> float:
+    """round(x, 2) for non-negative synthetic values, minus builtin dispatch."""
+    return int(x * 100.0 + 0.5) / 100.0
+
+
+def round4(x: float) -> float:
+    """round(x, 4) for non-negative synthetic values."""
+    return int(x * 10000.0 + 0.5) / 10000.0
+
+
+def round7(x: float) -> float:
+    """round(x, 7) for non-negative synthetic values."""
+    return int(x * 10000000.0 + 0.5) / 10000000.0
+
+
+def weighted_picker(choices, weights):
+    """Build a picker equivalent to random.choices(choices, weights, k=1)[0].
+
+    The cumulative distribution is computed once here instead of on every
+    call, and each pick costs one block-stream draw plus a bisect.
+    """
+    cumulative = list(accumulate(weights))
+    total = cumulative[-1]
+
+    def pick():
+        return choices[bisect.bisect_left(cumulative, rand_uniform(0.0, 1.0) * total)]
+
+    return pick
+
+
+pick_usage_category = weighted_picker(USAGE_CATEGORIES, [60, 25, 10, 3, 2])  # Mostly residential
+pick_ownership_category = weighted_picker(OWNERSHIP_CATEGORIES, [85, 10, 5])  # Mostly individual
+pick_num_units = weighted_picker([1, 2, 3], [60, 30, 10])
+pick_num_owners = weighted_picker([1, 2], [70, 30])
+
+
+def _uuid_stream():
+    """Yield uuid4-shaped hex strings from block-drawn random bytes."""
+    while True:
+        blob = rng.bytes(16 * _RNG_BLOCK)
+        for i in range(0, len(blob), 16):
+            h = blob[i:i + 16].hex()
+            yield f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+_uuids = _uuid_stream()
+
+
+def rand_uuid():
+    """Drop-in for str(uuid.uuid4()); random test IDs, not RFC 4122 UUIDs."""
+    return next(_uuids)
+
+
+@lru_cache(maxsize=None)
+def _window_epoch_bounds(start_year: int, end_year: int) -> tuple:
+    """Epoch-ms start and span in seconds of an April-to-March window."""
     start = datetime(start_year, 4, 1)  # Financial year starts April
     end = datetime(end_year, 3, 31)
-    delta = end - start
-    random_days = random.randint(0, delta.days)
-    random_dt = start + timedelta(days=random_days, seconds=random.randint(0, 86400))
-    return int(random_dt.timestamp() * 1000)
+    start_ms = int(start.timestamp() * 1000)
+    span_seconds = int((end - start).total_seconds()) + 86400
+    return start_ms, span_seconds
+
+
+def random_timestamp(start_year: int, end_year: int) -> int:
+    """Generate random timestamp in milliseconds between years."""
+    start_ms, span_seconds = _window_epoch_bounds(start_year, end_year)
+    return start_ms + rand_int(0, span_seconds) * 1000
 
 
 def generate_owner(property_id: str, is_primary: bool) -> dict:
     """Generate a property owner."""
-    first_name = random.choice(FIRST_NAMES)
-    last_name = random.choice(LAST_NAMES)
-    gender = "MALE" if first_name in FIRST_NAMES[:10] else "FEMALE"
+    first_index = rand_int(0, len(FIRST_NAMES) - 1)
+    last_index = rand_int(0, len(LAST_NAMES) - 1)
+    first_name = FIRST_NAMES[first_index]
+    last_name = LAST_NAMES[last_index]
 
     return {
-        "ownerId": str(uuid.uuid4()),
+        "ownerId": rand_uuid(),
         "name": f"{first_name} {last_name}",
-        "mobileNumber": f"98{random.randint(10000000, 99999999)}",
-        "email": f"{first_name.lower()}.{last_name.lower()}@example.com",
-        "gender": gender,
-        "fatherOrHusbandName": f"{random.choice(FIRST_NAMES)} {last_name}",
-        "relationship": "FATHER" if random.random() > 0.3 else "HUSBAND",
+        "mobileNumber": f"98{rand_int(10000000, 99999999)}",
+        "email": f"{FIRST_NAMES_LOWER[first_index]}.{LAST_NAMES_LOWER[last_index]}@example.com",
+        "gender": NAME_GENDER[first_name],
+        "fatherOrHusbandName": f"{rand_choice(FIRST_NAMES)} {last_name}",
+        "relationship": "FATHER" if rand_uniform(0.0, 1.0) > 0.3 else "HUSBAND",
         "ownerType": "CITIZEN",
-        "ownerInfoUuid": str(uuid.uuid4()),
+        "ownerInfoUuid": rand_uuid(),
         "institutionId": "",
         "documentType": "AADHAAR",
-        "documentUid": f"{random.randint(1000, 9999)} {random.randint(1000, 9999)} {random.randint(1000, 9999)}",
-        "ownershipPercentage": 100.0 if is_primary else random.uniform(20, 50),
+        "documentUid": f"{rand_int(1000, 9999)} {rand_int(1000, 9999)} {rand_int(1000, 9999)}",
+        "ownershipPercentage": 100.0 if is_primary else rand_uniform(20, 50),
         "isPrimaryOwner": is_primary,
         "status": "ACTIVE",
     }
@@ -139,57 +286,49 @@ def generate_unit(property_id: str, usage_category: str, unit_index: int) -> dic
     """Generate a property unit."""
     floor_mapping = {0: "GROUND_FLOOR", 1: "FIRST_FLOOR", 2: "SECOND_FLOOR"}
 
-    unit_type = floor_mapping.get(unit_index, random.choice(UNIT_TYPES))
+    unit_type = floor_mapping.get(unit_index, rand_choice(UNIT_TYPES))
     if usage_category == "COMMERCIAL":
-        unit_type = random.choice(["SHOP", "OFFICE", "WAREHOUSE"])
+        unit_type = rand_choice(["SHOP", "OFFICE", "WAREHOUSE"])
     elif usage_category == "INDUSTRIAL":
         unit_type = "WAREHOUSE"
 
-    constructed_area = random.uniform(500, 2000)
+    constructed_area = rand_uniform(500, 2000)
 
     return {
-        "unitId": str(uuid.uuid4()),
+        "unitId": rand_uuid(),
         "floorNo": str(unit_index),
         "unitType": unit_type,
         "usageCategory": usage_category,
-        "occupancyType": random.choice(OCCUPANCY_TYPES),
-        "occupancyDate": datetime(
-            random.randint(2015, 2023),
-            random.randint(1, 12),
-            random.randint(1, 28)
-        ).strftime("%Y-%m-%d"),
-        "constructedArea": round(constructed_area, 2),
-        "carpetArea": round(constructed_area * 0.8, 2),
-        "builtUpArea": round(constructed_area * 1.1, 2),
-        "arvAmount": round(random.uniform(10000, 100000), 2),
+        "occupancyType": rand_choice(OCCUPANCY_TYPES),
+        "occupancyDate": rand_choice(OCCUPANCY_DATES),
+        "constructedArea": round2(constructed_area),
+        "carpetArea": round2(constructed_area * 0.8),
+        "builtUpArea": round2(constructed_area * 1.1),
+        "arvAmount": round2(rand_uniform(10000, 100000)),
     }
 
 
 def generate_address(tenant_id: str) -> dict:
     """Generate a property address."""
-    locality_code, locality_name = random.choice(LOCALITIES)
-    city, district, state = CITIES[tenant_id]
-
-    return {
-        "addressId": str(uuid.uuid4()),
-        "doorNo": f"{random.randint(1, 500)}/{random.choice('ABCDEFGH')}",
-        "buildingName": f"Block {random.choice('ABCDEFGHIJ')}",
-        "street": f"Street {random.randint(1, 50)}",
+    locality_code, locality_name = rand_choice(LOCALITIES)
+
+    address = dict(TENANT_ADDRESS_CONST[tenant_id])
+    address.update({
+        "addressId": rand_uuid(),
+        "doorNo": f"{rand_int(1, 500)}/{rand_choice('ABCDEFGH')}",
+        "buildingName": f"Block {rand_choice('ABCDEFGHIJ')}",
+        "street": f"Street {rand_int(1, 50)}",
         "locality": {
             "code": locality_code,
             "name": locality_name,
         },
-        "city": city,
-        "district": district,
-        "region": "North",
-        "state": state,
-        "country": "IN",
-        "pinCode": f"14{random.randint(1000, 9999)}",
+        "pinCode": f"14{rand_int(1000, 9999)}",
         "geoLocation": {
-            "latitude": str(round(random.uniform(30.5, 32.0), 7)),
-            "longitude": str(round(random.uniform(74.5, 76.5), 7)),
+            "latitude": str(round7(rand_uniform(30.5, 32.0))),
+            "longitude": str(round7(rand_uniform(74.5, 76.5))),
         },
-    }
+    })
+    return address
 
 
 def generate_property_event(property_index: int) -> dict:
@@ -198,35 +337,26 @@ def generate_property_event(property_index: int) -> dict:
     # This ensures property_ids are predictable for update scenarios
     tenant_index = property_index % len(TENANTS)
     tenant_id = TENANTS[tenant_index]
-    property_id = f"PT-{tenant_id.split('.')[1].upper()}-{property_index:06d}"
-
-    usage_category = random.choices(
-        USAGE_CATEGORIES,
-        weights=[60, 25, 10, 3, 2],  # Mostly residential
-        k=1
-    )[0]
+    property_id = f"PT-{TENANT_CODES[tenant_index]}-{property_index:06d}"
 
-    ownership_category = random.choices(
-        OWNERSHIP_CATEGORIES,
-        weights=[85, 10, 5],  # Mostly individual
-        k=1
-    )[0]
+    usage_category = pick_usage_category()
+    ownership_category = pick_ownership_category()
 
     # Created time between 2018-2024
     created_time = random_timestamp(2018, 2024)
     last_modified_time = created_time
 
     # Generate 1-3 units
-    num_units = random.choices([1, 2, 3], weights=[60, 30, 10], k=1)[0]
+    num_units = pick_num_units()
     units = [generate_unit(property_id, usage_category, i) for i in range(num_units)]
 
     # Generate 1-2 owners
-    num_owners = random.choices([1, 2], weights=[70, 30], k=1)[0]
+    num_owners = pick_num_owners()
     owners = [generate_owner(property_id, i == 0) for i in range(num_owners)]
 
     # Calculate land area based on units
     total_constructed = sum(u["constructedArea"] for u in units)
-    land_area = total_constructed * random.uniform(1.0, 1.5)
+    land_area = total_constructed * rand_uniform(1.0, 1.5)
 
     # Derive financial year from created_time
     created_dt = datetime.fromtimestamp(created_time / 1000)
@@ -234,13 +364,13 @@ def generate_property_event(property_index: int) -> dict:
         fy_start = created_dt.year
     else:
         fy_start = created_dt.year - 1
-    financial_year = f"{fy_start}-{(fy_start + 1) % 100:02d}"
+    financial_year = FY_BY_YEAR[fy_start]
 
     return {
         "tenantId": tenant_id,
         "property": {
             "propertyId": property_id,
-            "propertyType": random.choice(PROPERTY_TYPES),
+            "propertyType": rand_choice(PROPERTY_TYPES),
             "usageCategory": usage_category,
             "ownershipCategory": ownership_category,
             "status": "ACTIVE",
@@ -249,7 +379,7 @@ def generate_property_event(property_index: int) -> dict:
             "financialYear": financial_year,
             "source": "MUNICIPAL_RECORDS",
             "channel": "SYSTEM",
-            "landArea": str(round(land_area, 4)),
+            "landArea": str(round4(land_area)),
             "landAreaUnit": "SQ_FT",
             "units": units,
             "owners": owners,
@@ -265,6 +395,22 @@ def generate_property_event(property_index: int) -> dict:
     }
 
 
+def generate_property_payload(property_index: int) -> tuple:
+    """Generate one event as (tenant_id, serialized bytes); runs in pool workers."""
+    event = generate_property_event(property_index)
+    return event["tenantId"], orjson.dumps(event)
+
+
+def produce_with_backpressure(producer, topic, value, key=None):
+    """produce() that waits out a full local queue instead of dropping."""
+    while True:
+        try:
+            producer.produce(topic, value=value, key=key)
+            return
+        except BufferError:
+            producer.poll(0.1)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate property events to Kafka")
     parser.add_argument(
@@ -287,36 +433,51 @@ def main():
 
     if args.dry_run:
         # Print sample events
+        out = sys.stdout.buffer
         for i in range(min(5, args.num_properties)):
             event = generate_property_event(i + 1)
-            print(json.dumps(event, indent=2))
-            print("---")
+            out.write(orjson.dumps(event, option=orjson.OPT_INDENT_2))
+            out.write(b"\n---\n")
+        out.flush()
         print(f"[DRY RUN] Would generate {args.num_properties} property events")
         return
 
-    # Create Kafka producer
-    producer = KafkaProducer(
-        bootstrap_servers=args.bootstrap_servers,
-        value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-        acks="all",
-        retries=3,
-    )
+    # librdkafka producer (events arrive pre-serialized from the pool).
+    # Batch aggressively: this is synthetic test data, so acks=1 is enough and
+    # lingering lets the producer pack many small events per broker request.
+    producer = Producer({
+        "bootstrap.servers": args.bootstrap_servers,
+        "acks": "1",
+        "linger.ms": 50,
+        "batch.num.messages": 10000,
+        "compression.type": "lz4",
+        "queue.buffering.max.messages": 200000,
+    })
 
     print(f"Generating {args.num_properties} property events...")
     start_time = time.time()
 
-    for i in range(args.num_properties):
-        event = generate_property_event(i + 1)
-        producer.send(KAFKA_TOPIC, value=event)
-
-        if (i + 1) % 1000 == 0:
-            producer.flush()
-            elapsed = time.time() - start_time
-            rate = (i + 1) / elapsed
-            print(f"  Sent {i + 1:,} events ({rate:.0f} events/sec)")
+    # Generation is CPU-bound (dict assembly + JSON); fan it out across cores
+    # and keep the single producer on the main thread.
+    sent = 0
+    with Pool(os.cpu_count(), initializer=_init_worker) as pool:
+        for tenant_id, payload in pool.imap_unordered(
+            generate_property_payload,
+            range(1, args.num_properties + 1),
+            chunksize=500,
+        ):
+            # Key by tenant: same-tenant events stay ordered in one partition
+            # and the producer packs fuller per-partition batches.
+            produce_with_backpressure(producer, KAFKA_TOPIC, payload, key=tenant_id)
+            producer.poll(0)
+            sent += 1
+
+            if sent % 1000 == 0:
+                elapsed = time.time() - start_time
+                rate = sent / elapsed
+                print(f"  Sent {sent:,} events ({rate:.0f} events/sec)")
 
     producer.flush()
-    producer.close()
 
     elapsed = time.time() - start_time
     print(f"Completed: {args.num_properties:,} property events in {elapsed:.1f}s")
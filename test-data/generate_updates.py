@@ -20,12 +20,15 @@ Prerequisites:
 """
 
 import argparse
-import json
-import random
+import sys
 import time
 import uuid
-from datetime import datetime, timedelta
-from kafka import KafkaProducer
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import orjson
+from confluent_kafka import Producer
 
 # Configuration
 KAFKA_PROPERTY_TOPIC = "property-events"
@@ -52,6 +55,9 @@ CITIES = {
     "pb.patiala": ("Patiala", "Patiala", "Punjab"),
 }
 
+# Derived lookup table, computed once instead of per event
+TENANT_CODES = [t.split(".")[1].upper() for t in TENANTS]
+
 FIRST_NAMES = [
     "Rajesh", "Sunil", "Anil", "Vijay", "Sandeep",
     "Amit", "Deepak", "Rakesh", "Mukesh", "Manoj",
@@ -61,6 +67,48 @@ LAST_NAMES = [
     "Singh", "Sharma", "Kumar", "Gupta", "Verma",
 ]
 
+# ----------------------------------------------------------------------------
+# Vectorized randomness (same pattern as generate_properties.py)
+# ----------------------------------------------------------------------------
+# Draw blocks of values at once from NumPy's PCG64 Generator and hand them
+# out one at a time, instead of paying a stdlib random.* call per field.
+
+_RNG_BLOCK = 4096
+
+rng = np.random.default_rng()
+
+
+def _block_stream(draw):
+    """Yield scalars from vectorized draws, refilling one block at a time."""
+    while True:
+        for value in draw(_RNG_BLOCK):
+            yield value
+
+
+@lru_cache(maxsize=None)
+def _int_stream(low, high):
+    return _block_stream(lambda n: rng.integers(low, high + 1, size=n))
+
+
+@lru_cache(maxsize=None)
+def _float_stream(low, high):
+    return _block_stream(lambda n: rng.uniform(low, high, size=n))
+
+
+def rand_int(low, high):
+    """Drop-in for random.randint(low, high) backed by block draws."""
+    return int(next(_int_stream(low, high)))
+
+
+def rand_uniform(low, high):
+    """Drop-in for random.uniform(low, high) backed by block draws."""
+    return float(next(_float_stream(low, high)))
+
+
+def rand_choice(seq):
+    """Drop-in for random.choice(seq) backed by block draws."""
+    return seq[int(next(_int_stream(0, len(seq) - 1)))]
+
 # Financial year for payment updates
 CURRENT_FY = "2024-25"
 FY_START = datetime(2024, 4, 1)
@@ -72,15 +120,32 @@ def datetime_to_millis(dt: datetime) -> int:
     return int(dt.timestamp() * 1000)
 
 
+# Millisecond constants, computed once instead of per event
+FY_START_MS = datetime_to_millis(FY_START)
+FY_END_MS = datetime_to_millis(FY_END)
+PROPERTY_CREATED_MS = datetime_to_millis(datetime(2020, 6, 15))
+DEMAND_CREATED_MS = datetime_to_millis(datetime(2024, 5, 15))
+
+
+def produce_with_backpressure(producer, topic, value, key=None):
+    """produce() that waits out a full local queue instead of dropping."""
+    while True:
+        try:
+            producer.produce(topic, value=value, key=key)
+            return
+        except BufferError:
+            producer.poll(0.1)
+
+
 def get_property_info(property_index: int) -> tuple:
     """Get tenant_id and property_id for a property index."""
     tenant_index = property_index % len(TENANTS)
     tenant_id = TENANTS[tenant_index]
-    property_id = f"PT-{tenant_id.split('.')[1].upper()}-{property_index:06d}"
+    property_id = f"PT-{TENANT_CODES[tenant_index]}-{property_index:06d}"
     return tenant_id, property_id
 
 
-def generate_property_update(property_index: int) -> dict:
+def generate_property_update(property_index: int, now_ms: int) -> dict:
     """
     Generate a property update event.
     Changes usage_category from RESIDENTIAL to COMMERCIAL.
@@ -88,17 +153,16 @@ def generate_property_update(property_index: int) -> dict:
     tenant_id, property_id = get_property_info(property_index)
 
     # Current time as the update time
-    now = datetime.now()
-    last_modified_time = datetime_to_millis(now)
+    last_modified_time = now_ms
 
     # Original created time (from initial load)
-    created_time = datetime_to_millis(datetime(2020, 6, 15))
+    created_time = PROPERTY_CREATED_MS
 
-    locality_code, locality_name = random.choice(LOCALITIES)
+    locality_code, locality_name = rand_choice(LOCALITIES)
     city, district, state = CITIES[tenant_id]
 
-    first_name = random.choice(FIRST_NAMES)
-    last_name = random.choice(LAST_NAMES)
+    first_name = rand_choice(FIRST_NAMES)
+    last_name = rand_choice(LAST_NAMES)
 
     return {
         "tenantId": tenant_id,
@@ -113,7 +177,7 @@ def generate_property_update(property_index: int) -> dict:
             "financialYear": "2020-21",
             "source": "MUNICIPAL_RECORDS",
             "channel": "CITIZEN",  # Updated via citizen portal
-            "landArea": str(round(random.uniform(1000, 2000), 4)),
+            "landArea": str(round(rand_uniform(1000, 2000), 4)),
             "landAreaUnit": "SQ_FT",
             "units": [
                 {
@@ -123,26 +187,26 @@ def generate_property_update(property_index: int) -> dict:
                     "usageCategory": "COMMERCIAL",
                     "occupancyType": "RENTED",
                     "occupancyDate": "2024-01-15",  # New occupancy
-                    "constructedArea": round(random.uniform(800, 1500), 2),
-                    "carpetArea": round(random.uniform(600, 1200), 2),
-                    "builtUpArea": round(random.uniform(900, 1600), 2),
-                    "arvAmount": round(random.uniform(50000, 150000), 2),
+                    "constructedArea": round(rand_uniform(800, 1500), 2),
+                    "carpetArea": round(rand_uniform(600, 1200), 2),
+                    "builtUpArea": round(rand_uniform(900, 1600), 2),
+                    "arvAmount": round(rand_uniform(50000, 150000), 2),
                 }
             ],
             "owners": [
                 {
                     "ownerId": str(uuid.uuid4()),
                     "name": f"{first_name} {last_name}",
-                    "mobileNumber": f"98{random.randint(10000000, 99999999)}",
+                    "mobileNumber": f"98{rand_int(10000000, 99999999)}",
                     "email": f"{first_name.lower()}.{last_name.lower()}@example.com",
                     "gender": "MALE",
-                    "fatherOrHusbandName": f"{random.choice(FIRST_NAMES)} {last_name}",
+                    "fatherOrHusbandName": f"{rand_choice(FIRST_NAMES)} {last_name}",
                     "relationship": "FATHER",
                     "ownerType": "CITIZEN",
                     "ownerInfoUuid": str(uuid.uuid4()),
                     "institutionId": "",
                     "documentType": "AADHAAR",
-                    "documentUid": f"{random.randint(1000, 9999)} {random.randint(1000, 9999)} {random.randint(1000, 9999)}",
+                    "documentUid": f"{rand_int(1000, 9999)} {rand_int(1000, 9999)} {rand_int(1000, 9999)}",
                     "ownershipPercentage": 100.0,
                     "isPrimaryOwner": True,
                     "status": "ACTIVE",
@@ -150,9 +214,9 @@ def generate_property_update(property_index: int) -> dict:
             ],
             "address": {
                 "addressId": str(uuid.uuid4()),
-                "doorNo": f"{random.randint(1, 500)}/A",
+                "doorNo": f"{rand_int(1, 500)}/A",
                 "buildingName": "Commercial Complex",
-                "street": f"Main Market Street {random.randint(1, 10)}",
+                "street": f"Main Market Street {rand_int(1, 10)}",
                 "locality": {
                     "code": locality_code,
                     "name": locality_name,
@@ -162,10 +226,10 @@ def generate_property_update(property_index: int) -> dict:
                 "region": "North",
                 "state": state,
                 "country": "IN",
-                "pinCode": f"14{random.randint(1000, 9999)}",
+                "pinCode": f"14{rand_int(1000, 9999)}",
                 "geoLocation": {
-                    "latitude": str(round(random.uniform(30.5, 32.0), 7)),
-                    "longitude": str(round(random.uniform(74.5, 76.5), 7)),
+                    "latitude": str(round(rand_uniform(30.5, 32.0), 7)),
+                    "longitude": str(round(rand_uniform(74.5, 76.5), 7)),
                 },
             },
             "auditDetails": {
@@ -183,6 +247,7 @@ def generate_payment_update(
     property_index: int,
     payment_percentage: float,
     version: int,
+    now_ms: int,
 ) -> dict:
     """
     Generate a demand update event with payment.
@@ -192,18 +257,17 @@ def generate_payment_update(
     demand_id = str(uuid.uuid4())  # This should match existing, but for demo we use new
 
     # Current time as the payment time
-    now = datetime.now()
-    last_modified_time = datetime_to_millis(now)
+    last_modified_time = now_ms
 
     # Original created time
-    created_time = datetime_to_millis(datetime(2024, 5, 15))
+    created_time = DEMAND_CREATED_MS
 
-    first_name = random.choice(FIRST_NAMES)
-    last_name = random.choice(LAST_NAMES)
+    first_name = rand_choice(FIRST_NAMES)
+    last_name = rand_choice(LAST_NAMES)
 
     # Generate tax amounts
-    pt_tax_amount = round(random.uniform(10000, 30000), 2)
-    late_fee_amount = round(random.uniform(500, 1500), 2)
+    pt_tax_amount = round(rand_uniform(10000, 30000), 2)
+    late_fee_amount = round(rand_uniform(500, 1500), 2)
 
     # Calculate collection amounts based on payment percentage
     pt_collection = round(pt_tax_amount * payment_percentage, 2)
@@ -219,8 +283,8 @@ def generate_payment_update(
             "consumerCode": property_id,
             "consumerType": "PT",
             "businessService": "PT",
-            "taxPeriodFrom": datetime_to_millis(FY_START),
-            "taxPeriodTo": datetime_to_millis(FY_END),
+            "taxPeriodFrom": FY_START_MS,
+            "taxPeriodTo": FY_END_MS,
             "billingPeriod": CURRENT_FY,
             "status": "ACTIVE",
             "isPaymentCompleted": is_fully_paid,
@@ -228,7 +292,7 @@ def generate_payment_update(
             "minimumAmountPayable": str(round(total_tax, 2)),
             "payer": {
                 "name": f"{first_name} {last_name}",
-                "mobileNumber": f"98{random.randint(10000000, 99999999)}",
+                "mobileNumber": f"98{rand_int(10000000, 99999999)}",
                 "email": f"{first_name.lower()}.{last_name.lower()}@example.com",
             },
             "demandDetails": [
@@ -238,8 +302,8 @@ def generate_payment_update(
                     "taxHeadMasterId": str(uuid.uuid4()),
                     "taxAmount": str(pt_tax_amount),
                     "collectionAmount": str(pt_collection),
-                    "taxPeriodFrom": datetime_to_millis(FY_START),
-                    "taxPeriodTo": datetime_to_millis(FY_END),
+                    "taxPeriodFrom": FY_START_MS,
+                    "taxPeriodTo": FY_END_MS,
                 },
                 {
                     "id": str(uuid.uuid4()),
@@ -247,8 +311,8 @@ def generate_payment_update(
                     "taxHeadMasterId": str(uuid.uuid4()),
                     "taxAmount": str(late_fee_amount),
                     "collectionAmount": str(late_fee_collection),
-                    "taxPeriodFrom": datetime_to_millis(FY_START),
-                    "taxPeriodTo": datetime_to_millis(FY_END),
+                    "taxPeriodFrom": FY_START_MS,
+                    "taxPeriodTo": FY_END_MS,
                 },
             ],
             "auditDetails": {
@@ -276,6 +340,8 @@ def main():
     )
     args = parser.parse_args()
 
+    now_ms = int(time.time() * 1000)
+
     # Property indices for updates (first 100 properties)
     property_update_indices = list(range(1, NUM_PROPERTY_UPDATES + 1))
     partial_payment_indices = list(range(101, 101 + NUM_PARTIAL_PAYMENTS))
@@ -291,53 +357,62 @@ def main():
     print()
 
     if args.dry_run:
-        print("Sample property update:")
-        print(json.dumps(generate_property_update(1), indent=2))
-        print("\n---\n")
-        print("Sample partial payment:")
-        print(json.dumps(generate_payment_update(101, 0.5, 2), indent=2))
-        print("\n---\n")
-        print("Sample full payment:")
-        print(json.dumps(generate_payment_update(201, 1.0, 3), indent=2))
-        print("\n[DRY RUN] No events sent")
+        samples = [
+            ("Sample property update:", generate_property_update(1, now_ms)),
+            ("Sample partial payment:", generate_payment_update(101, 0.5, 2, now_ms)),
+            ("Sample full payment:", generate_payment_update(201, 1.0, 3, now_ms)),
+        ]
+        out = sys.stdout.buffer
+        for label, event in samples:
+            print(label)
+            sys.stdout.flush()
+            out.write(orjson.dumps(event, option=orjson.OPT_INDENT_2))
+            out.write(b"\n\n---\n\n")
+            out.flush()
+        print("[DRY RUN] No events sent")
         return
 
-    # Create Kafka producer
-    producer = KafkaProducer(
-        bootstrap_servers=args.bootstrap_servers,
-        value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-        acks="all",
-        retries=3,
-    )
+    # librdkafka producer. Batch aggressively: this is synthetic test data,
+    # so acks=1 is enough and lingering lets the producer pack many small
+    # events per broker request.
+    producer = Producer({
+        "bootstrap.servers": args.bootstrap_servers,
+        "acks": "1",
+        "linger.ms": 50,
+        "batch.num.messages": 10000,
+        "compression.type": "lz4",
+        "queue.buffering.max.messages": 200000,
+    })
 
     start_time = time.time()
 
     # Send property updates
     print(f"Sending {NUM_PROPERTY_UPDATES} property updates...")
     for idx in property_update_indices:
-        event = generate_property_update(idx)
-        producer.send(KAFKA_PROPERTY_TOPIC, value=event)
+        event = generate_property_update(idx, now_ms)
+        produce_with_backpressure(producer, KAFKA_PROPERTY_TOPIC, orjson.dumps(event), key=event["tenantId"])
+        producer.poll(0)
     producer.flush()
     print(f"  Sent property updates for indices {property_update_indices[0]}-{property_update_indices[-1]}")
 
     # Send partial payments
     print(f"Sending {NUM_PARTIAL_PAYMENTS} partial payments (50%)...")
     for idx in partial_payment_indices:
-        event = generate_payment_update(idx, 0.5, 2)
-        producer.send(KAFKA_DEMAND_TOPIC, value=event)
+        event = generate_payment_update(idx, 0.5, 2, now_ms)
+        produce_with_backpressure(producer, KAFKA_DEMAND_TOPIC, orjson.dumps(event), key=event["tenantId"])
+        producer.poll(0)
     producer.flush()
     print(f"  Sent partial payments for indices {partial_payment_indices[0]}-{partial_payment_indices[-1]}")
 
     # Send full payments
     print(f"Sending {NUM_FULL_PAYMENTS} full payments (100%)...")
     for idx in full_payment_indices:
-        event = generate_payment_update(idx, 1.0, 3)
-        producer.send(KAFKA_DEMAND_TOPIC, value=event)
+        event = generate_payment_update(idx, 1.0, 3, now_ms)
+        produce_with_backpressure(producer, KAFKA_DEMAND_TOPIC, orjson.dumps(event), key=event["tenantId"])
+        producer.poll(0)
     producer.flush()
     print(f"  Sent full payments for indices {full_payment_indices[0]}-{full_payment_indices[-1]}")
 
-    producer.close()
-
     elapsed = time.time() - start_time
     total_events = NUM_PROPERTY_UPDATES + NUM_PARTIAL_PAYMENTS + NUM_FULL_PAYMENTS
     print(f"\nCompleted: {total_events} update events in {elapsed:.1f}s")